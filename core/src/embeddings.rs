@@ -796,15 +796,35 @@ impl EmbeddingService {
     }
 
     /// Generate embeddings for multiple texts
+    ///
+    /// Each distinct text is sent to the provider once, and repeated texts
+    /// share its embedding in the returned list.
     pub async fn embed_texts(&self, texts: &[String]) -> GraphBitResult<Vec<Vec<f32>>> {
+        let (unique_texts, slots) = dedup_texts(texts);
+        let unique_count = unique_texts.len();
+
         let request = EmbeddingRequest {
-            input: EmbeddingInput::Multiple(texts.to_vec()),
+            input: EmbeddingInput::Multiple(unique_texts),
             user: None,
             params: HashMap::new(),
         };
 
         let response = self.provider.generate_embeddings(request).await?;
-        Ok(response.embeddings)
+        if unique_count == texts.len() {
+            return Ok(response.embeddings);
+        }
+
+        if response.embeddings.len() != unique_count {
+            return Err(GraphBitError::llm(format!(
+                "Expected {unique_count} embeddings, got {}",
+                response.embeddings.len()
+            )));
+        }
+
+        Ok(slots
+            .into_iter()
+            .map(|slot| response.embeddings[slot].clone())
+            .collect())
     }
 
     /// Process a batch of embedding requests with lock-free concurrency control
@@ -941,10 +961,45 @@ impl EmbeddingService {
     }
 }
 
+/// Collapse repeated texts, returning the distinct texts in first-seen order
+/// and, for each input, the index of its distinct text.
+fn dedup_texts(texts: &[String]) -> (Vec<String>, Vec<usize>) {
+    let mut first_seen: HashMap<&str, usize> = HashMap::with_capacity(texts.len());
+    let mut unique_texts = Vec::with_capacity(texts.len());
+
+    let slots = texts
+        .iter()
+        .map(|text| {
+            *first_seen.entry(text.as_str()).or_insert_with(|| {
+                unique_texts.push(text.clone());
+                unique_texts.len() - 1
+            })
+        })
+        .collect();
+
+    (unique_texts, slots)
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_dedup_texts() {
+        let texts: Vec<String> = ["a", "b", "a", "c", "b"]
+            .iter()
+            .map(ToString::to_string)
+            .collect();
+        let (unique, slots) = dedup_texts(&texts);
+        assert_eq!(unique, vec!["a", "b", "c"]);
+        assert_eq!(slots, vec![0, 1, 0, 2, 1]);
+
+        let texts = vec!["x".to_string(), "y".to_string()];
+        let (unique, slots) = dedup_texts(&texts);
+        assert_eq!(unique, texts);
+        assert_eq!(slots, vec![0, 1]);
+    }
+
     #[test]
     fn test_embedding_input() {
         let single = EmbeddingInput::Single("test".to_string());
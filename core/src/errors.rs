@@ -9,6 +9,9 @@ use thiserror::Error;
 /// Result type alias for `GraphBit` operations
 pub type GraphBitResult<T> = Result<T, GraphBitError>;
 
+/// Wait used for a rate-limited response that carries no usable `Retry-After`
+pub const DEFAULT_RATE_LIMIT_RETRY_SECONDS: u64 = 1;
+
 /// Comprehensive error types for the `GraphBit` framework
 #[derive(Error, Debug, Clone, Serialize, Deserialize)]
 pub enum GraphBitError {
@@ -98,12 +101,15 @@ pub enum GraphBitError {
     },
 
     /// Rate limiting errors
-    #[error("Rate limit exceeded: {provider} - retry after {retry_after_seconds}s")]
+    #[error("Rate limit exceeded: {provider} - retry after {retry_after_seconds}s - {message}")]
     RateLimit {
         /// Provider name
         provider: String,
         /// Seconds to wait before retrying
         retry_after_seconds: u64,
+        /// Error text reported by the provider
+        #[serde(default)]
+        message: String,
     },
 
     /// Generic internal errors
@@ -208,7 +214,37 @@ impl GraphBitError {
         Self::RateLimit {
             provider: provider.into(),
             retry_after_seconds,
+            message: "Too many requests".to_string(),
+        }
+    }
+
+    /// Map an HTTP 429 provider response to a rate limit error
+    ///
+    /// Honours a `Retry-After` header given in seconds and falls back to
+    /// [`DEFAULT_RATE_LIMIT_RETRY_SECONDS`] when it is absent or an HTTP date.
+    /// `body` is the already-read response text and is kept as the error
+    /// message. Returns `None` for any other status.
+    pub fn rate_limit_from_response(
+        provider: impl Into<String>,
+        status: reqwest::StatusCode,
+        headers: &reqwest::header::HeaderMap,
+        body: &str,
+    ) -> Option<Self> {
+        if status != reqwest::StatusCode::TOO_MANY_REQUESTS {
+            return None;
         }
+
+        let retry_after_seconds = headers
+            .get(reqwest::header::RETRY_AFTER)
+            .and_then(|value| value.to_str().ok())
+            .and_then(|value| value.trim().parse().ok())
+            .unwrap_or(DEFAULT_RATE_LIMIT_RETRY_SECONDS);
+
+        Some(Self::RateLimit {
+            provider: provider.into(),
+            retry_after_seconds,
+            message: body.to_string(),
+        })
     }
 
     /// Create a new concurrency error
@@ -216,10 +216,19 @@ impl AzureLlmProvider {
             .map_err(|e| GraphBitError::llm_provider("azurellm", format!("Request failed: {e}")))?;
 
         if !response.status().is_success() {
+            let status = response.status();
+            let headers = response.headers().clone();
             let error_text = response
                 .text()
                 .await
                 .unwrap_or_else(|_| "Unknown error".to_string());
+
+            if let Some(error) =
+                GraphBitError::rate_limit_from_response("azurellm", status, &headers, &error_text)
+            {
+                return Err(error);
+            }
+
             return Err(GraphBitError::llm_provider(
                 "azurellm",
                 format!("Responses API error: {error_text}"),
@@ -512,10 +521,19 @@ impl LlmProviderTrait for AzureLlmProvider {
             .map_err(|e| GraphBitError::llm_provider("azurellm", format!("Request failed: {e}")))?;
 
         if !response.status().is_success() {
+            let status = response.status();
+            let headers = response.headers().clone();
             let error_text = response
                 .text()
                 .await
                 .unwrap_or_else(|_| "Unknown error".to_string());
+
+            if let Some(error) =
+                GraphBitError::rate_limit_from_response("azurellm", status, &headers, &error_text)
+            {
+                return Err(error);
+            }
+
             return Err(GraphBitError::llm_provider(
                 "azurellm",
                 format!("API error: {error_text}"),
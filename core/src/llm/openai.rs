@@ -247,10 +247,19 @@ impl LlmProviderTrait for OpenAiProvider {
             .map_err(|e| GraphBitError::llm_provider("openai", format!("Request failed: {e}")))?;
 
         if !response.status().is_success() {
+            let status = response.status();
+            let headers = response.headers().clone();
             let error_text = response
                 .text()
                 .await
                 .unwrap_or_else(|_| "Unknown error".to_string());
+
+            if let Some(error) =
+                GraphBitError::rate_limit_from_response("openai", status, &headers, &error_text)
+            {
+                return Err(error);
+            }
+
             return Err(GraphBitError::llm_provider(
                 "openai",
                 format!("API error: {error_text}"),
@@ -353,6 +362,8 @@ impl LlmProviderTrait for OpenAiProvider {
             .map_err(|e| GraphBitError::llm_provider("openai", format!("Request failed: {e}")))?;
 
         if !response.status().is_success() {
+            let status = response.status();
+            let headers = response.headers().clone();
             // Apply timeout to reading error body to prevent hanging on malformed responses
             let error_text = timeout(ERROR_BODY_TIMEOUT, response.text())
                 .await
@@ -364,6 +375,12 @@ impl LlmProviderTrait for OpenAiProvider {
                 })
                 .unwrap_or_else(|_| "Unknown error (failed to read body)".to_string());
 
+            if let Some(error) =
+                GraphBitError::rate_limit_from_response("openai", status, &headers, &error_text)
+            {
+                return Err(error);
+            }
+
             return Err(GraphBitError::llm_provider(
                 "openai",
                 format!("API error: {error_text}"),
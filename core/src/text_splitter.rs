@@ -7,6 +7,7 @@ use crate::errors::{GraphBitError, GraphBitResult};
 use regex::Regex;
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
+use std::sync::LazyLock;
 
 /// Configuration for text splitting operations
 #[derive(Debug, Clone, Serialize, Deserialize)]
@@ -219,20 +220,19 @@ impl TextSplitterTrait for CharacterSplitter {
             return Ok(Vec::new());
         }
 
-        let mut chunks = Vec::new();
-        let mut chunk_index = 0;
+        // Map character index to byte index in a single pass; the map grows
+        // with the character count instead of being pre-sized by byte length
+        let mut char_to_byte_map: Vec<usize> =
+            text.char_indices().map(|(byte_idx, _)| byte_idx).collect();
+        let total_chars = char_to_byte_map.len();
 
-        // Build a mapping of character index to byte index
-        let char_to_byte: Vec<(usize, usize)> = text
-            .char_indices()
-            .enumerate()
-            .map(|(char_idx, (byte_idx, _))| (char_idx, byte_idx))
-            .collect();
+        // Size the output for the expected number of strides up front
+        let stride = self.chunk_size - self.chunk_overlap;
+        let mut chunks = Vec::with_capacity(total_chars.div_ceil(stride));
+        let mut chunk_index = 0;
 
         // Add the end position
-        let total_chars = text.chars().count();
-        let mut char_to_byte_map = char_to_byte;
-        char_to_byte_map.push((total_chars, text.len()));
+        char_to_byte_map.push(text.len());
 
         let mut char_start = 0;
 
@@ -240,8 +240,8 @@ impl TextSplitterTrait for CharacterSplitter {
             let mut char_end = (char_start + self.chunk_size).min(total_chars);
 
             // Get byte positions
-            let mut byte_start = char_to_byte_map[char_start].1;
-            let mut byte_end = char_to_byte_map[char_end].1;
+            let mut byte_start = char_to_byte_map[char_start];
+            let mut byte_end = char_to_byte_map[char_end];
 
             // Preserve word boundaries if enabled
             if self.config.preserve_word_boundaries && char_end < total_chars {
@@ -259,7 +259,7 @@ impl TextSplitterTrait for CharacterSplitter {
 
                     // Find the corresponding character position
                     for i in (char_start..char_end).rev() {
-                        if char_to_byte_map[i + 1].1 == byte_end {
+                        if char_to_byte_map[i + 1] == byte_end {
                             char_end = i + 1;
                             break;
                         }
@@ -328,10 +328,24 @@ pub struct TokenSplitter {
     token_pattern: Regex,
 }
 
+/// Default token pattern: runs of word characters, whitespace, or other symbols.
+///
+/// The three branches partition every character, so explicit `\b` anchors are
+/// redundant. Leaving them out keeps the pattern eligible for the regex crate's
+/// DFA engines on non-ASCII input instead of falling back to the slower PikeVM.
+const DEFAULT_TOKEN_PATTERN: &str = r"\w+|\s+|[^\w\s]+";
+
+/// Compiled default token pattern, shared by every splitter that uses it.
+///
+/// Cloning a `Regex` shares the compiled program, so new splitters skip
+/// recompiling the Unicode-aware pattern.
+static DEFAULT_TOKEN_REGEX: LazyLock<Regex> =
+    LazyLock::new(|| Regex::new(DEFAULT_TOKEN_PATTERN).expect("default token pattern is valid"));
+
 impl TokenSplitter {
     /// Create a new token splitter
     pub fn new(chunk_size: usize, chunk_overlap: usize) -> GraphBitResult<Self> {
-        Self::with_pattern(chunk_size, chunk_overlap, r"\b\w+\b|\s+|[^\w\s]+")
+        Self::with_pattern(chunk_size, chunk_overlap, DEFAULT_TOKEN_PATTERN)
     }
 
     /// Create a token splitter with custom token pattern
@@ -354,9 +368,13 @@ impl TokenSplitter {
             ));
         }
 
-        let token_pattern = Regex::new(pattern).map_err(|e| {
-            GraphBitError::validation("text_splitter", format!("Invalid regex pattern: {e}"))
-        })?;
+        let token_pattern = if pattern == DEFAULT_TOKEN_PATTERN {
+            DEFAULT_TOKEN_REGEX.clone()
+        } else {
+            Regex::new(pattern).map_err(|e| {
+                GraphBitError::validation("text_splitter", format!("Invalid regex pattern: {e}"))
+            })?
+        };
 
         let config = TextSplitterConfig {
             strategy: SplitterStrategy::Token {
@@ -393,7 +411,8 @@ impl TextSplitterTrait for TokenSplitter {
             return Ok(Vec::new());
         }
 
-        let mut chunks = Vec::new();
+        let stride = self.chunk_size - self.chunk_overlap;
+        let mut chunks = Vec::with_capacity(tokens.len().div_ceil(stride));
         let mut chunk_index = 0;
         let mut i = 0;
 
@@ -406,15 +425,25 @@ impl TextSplitterTrait for TokenSplitter {
             let last_token = tokens[chunk_end - 1];
             let end_pos = last_token.as_ptr() as usize - text.as_ptr() as usize + last_token.len();
 
-            let content = chunk_tokens.join("");
+            // Tokens from the default pattern tile the source span, so slice it
+            // directly instead of joining copies into a temporary buffer
+            let joined;
+            let span = &text[start_pos..end_pos];
+            let content = if chunk_tokens.iter().map(|t| t.len()).sum::<usize>() == span.len() {
+                span
+            } else {
+                joined = chunk_tokens.concat();
+                joined.as_str()
+            };
             let content = if self.config.trim_whitespace {
-                content.trim().to_string()
+                content.trim()
             } else {
                 content
             };
 
             if !content.is_empty() {
-                let mut chunk = TextChunk::new(content, start_pos, end_pos, chunk_index);
+                let mut chunk =
+                    TextChunk::new(content.to_string(), start_pos, end_pos, chunk_index);
                 chunk.metadata.insert(
                     "token_count".to_string(),
                     serde_json::Value::Number(chunk_tokens.len().into()),
@@ -457,16 +486,23 @@ pub struct SentenceSplitter {
     sentence_pattern: Regex,
 }
 
+/// Default sentence ending patterns
+const DEFAULT_SENTENCE_ENDINGS: [&str; 3] = [
+    r"[.!?]+[\s\n]+",
+    r"[。！？]+[\s\n]*", // Chinese/Japanese
+    r"[\n\r]+",          // Newlines as sentence boundaries
+];
+
+/// Compiled default sentence pattern, shared by every splitter that uses it
+static DEFAULT_SENTENCE_REGEX: LazyLock<Regex> = LazyLock::new(|| {
+    Regex::new(&format!("({})", DEFAULT_SENTENCE_ENDINGS.join("|")))
+        .expect("default sentence pattern is valid")
+});
+
 impl SentenceSplitter {
     /// Create a new sentence splitter
     pub fn new(chunk_size: usize, chunk_overlap: usize) -> GraphBitResult<Self> {
-        let default_endings = vec![
-            r"[.!?]+[\s\n]+",
-            r"[。！？]+[\s\n]*", // Chinese/Japanese
-            r"[\n\r]+",          // Newlines as sentence boundaries
-        ];
-
-        Self::with_endings(chunk_size, chunk_overlap, default_endings)
+        Self::with_endings(chunk_size, chunk_overlap, DEFAULT_SENTENCE_ENDINGS.to_vec())
     }
 
     /// Create a sentence splitter with custom sentence endings
@@ -482,10 +518,14 @@ impl SentenceSplitter {
             ));
         }
 
-        let pattern = format!("({})", endings.join("|"));
-        let sentence_pattern = Regex::new(&pattern).map_err(|e| {
-            GraphBitError::validation("text_splitter", format!("Invalid regex pattern: {e}"))
-        })?;
+        let sentence_pattern = if endings == DEFAULT_SENTENCE_ENDINGS {
+            DEFAULT_SENTENCE_REGEX.clone()
+        } else {
+            let pattern = format!("({})", endings.join("|"));
+            Regex::new(&pattern).map_err(|e| {
+                GraphBitError::validation("text_splitter", format!("Invalid regex pattern: {e}"))
+            })?
+        };
 
         let config = TextSplitterConfig {
             strategy: SplitterStrategy::Sentence {
@@ -532,8 +572,9 @@ impl TextSplitterTrait for SentenceSplitter {
             }
         }
 
-        // Group sentences into chunks
-        let mut chunks = Vec::new();
+        // Group sentences into chunks; there is never more than one per sentence
+        let mut chunks =
+            Vec::with_capacity((text.len() / self.chunk_size + 1).min(sentences.len()));
         let mut chunk_index = 0;
         let mut i = 0;
 
@@ -555,16 +596,35 @@ impl TextSplitterTrait for SentenceSplitter {
             // Create chunk from sentences[i..j]
             let start_pos = sentences[i].1;
             let end_pos = sentences[j - 1].2;
-            let content: String = sentences[i..j].iter().map(|(s, _, _)| *s).collect();
+            // Sentences are normally contiguous, so slice the source span directly
+            // and only fall back to concatenation when whitespace-only sentences
+            // were skipped in between
+            let joined;
+            let span = &text[start_pos..end_pos];
+            let content = if sentences[i..j]
+                .iter()
+                .map(|(s, _, _)| s.len())
+                .sum::<usize>()
+                == span.len()
+            {
+                span
+            } else {
+                joined = sentences[i..j]
+                    .iter()
+                    .map(|(s, _, _)| *s)
+                    .collect::<String>();
+                joined.as_str()
+            };
 
             let content = if self.config.trim_whitespace {
-                content.trim().to_string()
+                content.trim()
             } else {
                 content
             };
 
             if !content.is_empty() {
-                let mut chunk = TextChunk::new(content, start_pos, end_pos, chunk_index);
+                let mut chunk =
+                    TextChunk::new(content.to_string(), start_pos, end_pos, chunk_index);
                 chunk.metadata.insert(
                     "sentence_count".to_string(),
                     serde_json::Value::Number((j - i).into()),
@@ -739,7 +799,7 @@ impl TextSplitterTrait for RecursiveSplitter {
         }
 
         let parts = self.recursive_split(text, &self.separators);
-        let mut chunks = Vec::new();
+        let mut chunks = Vec::with_capacity(parts.len());
         let mut position = 0;
 
         for (chunk_index, part) in parts.iter().enumerate() {
@@ -769,7 +829,7 @@ impl TextSplitterTrait for RecursiveSplitter {
 
         // Apply overlap if needed
         if self.chunk_overlap > 0 && chunks.len() > 1 {
-            let mut overlapped_chunks = Vec::new();
+            let mut overlapped_chunks = Vec::with_capacity(chunks.len());
 
             for i in 0..chunks.len() {
                 let mut chunk_content = chunks[i].content.clone();
@@ -141,9 +141,13 @@ pub(crate) fn to_py_error(error: graphbit_core::errors::GraphBitError) -> PyErr
             message: message.clone(),
             provider: None,
         },
-        GraphBitError::RateLimit { .. } => PythonBindingError::RateLimit {
-            message: "Rate limit exceeded".to_string(),
-            retry_after: None,
+        GraphBitError::RateLimit {
+            retry_after_seconds,
+            message,
+            ..
+        } => PythonBindingError::RateLimit {
+            message: message.clone(),
+            retry_after: Some(retry_after_seconds),
         },
         GraphBitError::Validation { message, .. } => PythonBindingError::Validation {
             message: message.clone(),
@@ -3,17 +3,19 @@
 //! This module provides a robust, high-performance LLM client with:
 //! - Connection pooling and reuse
 //! - Circuit breaker pattern for resilience
-//! - Automatic retry with exponential backoff
+//! - Automatic retry with jittered exponential backoff, honouring rate-limit
+//!   retry hints and skipping non-retryable errors
 //! - Comprehensive timeout handling
 //! - Request/response validation
 //! - Performance monitoring and metrics
 
 use futures::{Stream, StreamExt};
-use graphbit_core::errors::GraphBitResult;
+use graphbit_core::errors::{GraphBitError, GraphBitResult};
 use graphbit_core::llm::{LlmMessage, LlmProviderTrait, LlmRequest};
 use pyo3::prelude::*;
 use pyo3::types::{PyAny, PyDict};
 use std::pin::Pin;
+use std::sync::atomic::{AtomicU64, Ordering};
 use std::sync::Arc;
 use std::time::{Duration, Instant};
 use tokio::sync::RwLock;
@@ -151,14 +153,76 @@ impl CircuitBreaker {
 }
 
 /// Client statistics for monitoring
-#[derive(Debug, Clone)]
+///
+/// Counters are atomics so request paths and stats readers never wait on a lock.
+#[derive(Debug, Default)]
 pub(crate) struct ClientStats {
-    pub total_requests: u64,
-    pub successful_requests: u64,
-    pub failed_requests: u64,
-    pub average_response_time_ms: f64,
-    pub circuit_breaker_state: String,
-    pub uptime: Duration,
+    total_requests: AtomicU64,
+    successful_requests: AtomicU64,
+    failed_requests: AtomicU64,
+    /// Sum of successful response times in microseconds
+    total_response_time_us: AtomicU64,
+    /// Exponentially weighted moving average of response time in
+    /// milliseconds, stored as `f64` bits (zero until the first sample)
+    recent_response_time_ms_bits: AtomicU64,
+}
+
+/// Weight given to the newest sample in the response-time moving average
+const RESPONSE_TIME_EWMA_ALPHA: f64 = 0.1;
+
+impl ClientStats {
+    fn record_request(&self) {
+        self.total_requests.fetch_add(1, Ordering::Relaxed);
+    }
+
+    fn record_success(&self, duration: Duration) {
+        self.successful_requests.fetch_add(1, Ordering::Relaxed);
+        self.total_response_time_us
+            .fetch_add(duration.as_micros() as u64, Ordering::Relaxed);
+
+        let sample_ms = duration.as_secs_f64() * 1000.0;
+        // The closure always returns Some, so the update cannot fail
+        let _ = self.recent_response_time_ms_bits.fetch_update(
+            Ordering::Relaxed,
+            Ordering::Relaxed,
+            |bits| {
+                let updated = if bits == 0 {
+                    sample_ms
+                } else {
+                    let current = f64::from_bits(bits);
+                    current + RESPONSE_TIME_EWMA_ALPHA * (sample_ms - current)
+                };
+                Some(updated.to_bits())
+            },
+        );
+    }
+
+    fn record_failure(&self) {
+        self.failed_requests.fetch_add(1, Ordering::Relaxed);
+    }
+
+    fn reset(&self) {
+        self.total_requests.store(0, Ordering::Relaxed);
+        self.successful_requests.store(0, Ordering::Relaxed);
+        self.failed_requests.store(0, Ordering::Relaxed);
+        self.total_response_time_us.store(0, Ordering::Relaxed);
+        self.recent_response_time_ms_bits
+            .store(0, Ordering::Relaxed);
+    }
+
+    /// Mean response time of successful requests in milliseconds
+    fn average_response_time_ms(&self) -> f64 {
+        let successful = self.successful_requests.load(Ordering::Relaxed);
+        if successful == 0 {
+            return 0.0;
+        }
+        self.total_response_time_us.load(Ordering::Relaxed) as f64 / successful as f64 / 1000.0
+    }
+
+    /// Moving average of recent response times in milliseconds
+    fn recent_response_time_ms(&self) -> f64 {
+        f64::from_bits(self.recent_response_time_ms_bits.load(Ordering::Relaxed))
+    }
 }
 
 /// Production-grade LLM client with resilience patterns
@@ -167,7 +231,7 @@ pub struct LlmClient {
     provider: Arc<RwLock<Box<dyn LlmProviderTrait>>>,
     circuit_breaker: Arc<CircuitBreaker>,
     config: ClientConfig,
-    stats: Arc<RwLock<ClientStats>>,
+    stats: Arc<ClientStats>,
     created_at: Instant,
     /// Cache for warmup to avoid repeated initialization overhead
     warmed_up: Arc<tokio::sync::OnceCell<()>>,
@@ -212,14 +276,7 @@ impl LlmClient {
 
         let circuit_breaker = Arc::new(CircuitBreaker::new(client_config.clone()));
 
-        let stats = Arc::new(RwLock::new(ClientStats {
-            total_requests: 0,
-            successful_requests: 0,
-            failed_requests: 0,
-            average_response_time_ms: 0.0,
-            circuit_breaker_state: "Closed".to_string(),
-            uptime: Duration::from_secs(0),
-        }));
+        let stats = Arc::new(ClientStats::default());
 
         if client_config.debug {
             info!("Created LLM client with config: {:?}", client_config);
@@ -499,44 +556,15 @@ impl LlmClient {
                 );
             }
 
-            // High-performance streaming with buffered execution and resilience
-            let results = futures::stream::iter(requests)
-                .map(|request| {
-                    let provider = Arc::clone(&provider);
-                    let circuit_breaker = Arc::clone(&circuit_breaker);
-                    let stats = Arc::clone(&stats);
-                    let config = config.clone();
-
-                    async move {
-                        Self::execute_request_with_resilience(
-                            provider,
-                            circuit_breaker,
-                            stats,
-                            config,
-                            request,
-                        )
-                        .await
-                    }
-                })
-                .buffer_unordered(concurrency)
-                .collect::<Vec<_>>()
-                .await;
-
-            // Pre-allocate response vector for efficiency
-            let mut responses = Vec::with_capacity(results.len());
-            for res in results {
-                match res {
-                    Ok(response) => responses.push(response.content),
-                    Err(e) => {
-                        if config.debug {
-                            warn!("Batch request failed: {}", e);
-                        }
-                        responses.push(format!("Error: {}", e));
-                    }
-                }
-            }
-
-            Ok(responses)
+            Ok(Self::execute_batch(
+                provider,
+                circuit_breaker,
+                stats,
+                config,
+                requests,
+                concurrency,
+            )
+            .await)
         })
     }
 
@@ -724,38 +752,50 @@ impl LlmClient {
 
     /// Get comprehensive client statistics
     fn get_stats<'a>(&self, py: Python<'a>) -> PyResult<Bound<'a, PyDict>> {
-        let stats = get_runtime().block_on(async {
-            let mut stats = self.stats.read().await.clone();
-            stats.uptime = self.created_at.elapsed();
-
-            // Get circuit breaker state
-            let cb_state = self.circuit_breaker.state.read().await;
-            stats.circuit_breaker_state = match *cb_state {
-                CircuitBreakerState::Closed { failure_count } => {
-                    format!("Closed (failures: {})", failure_count)
-                }
-                CircuitBreakerState::Open { .. } => "Open".to_string(),
-                CircuitBreakerState::HalfOpen => "HalfOpen".to_string(),
-            };
+        let circuit_breaker = Arc::clone(&self.circuit_breaker);
 
-            stats
+        // Release GIL while waiting on the circuit breaker lock so monitoring
+        // threads never stall Python threads that are driving requests
+        let circuit_breaker_state = py.allow_threads(|| {
+            get_runtime().block_on(async move {
+                match *circuit_breaker.state.read().await {
+                    CircuitBreakerState::Closed { failure_count } => {
+                        format!("Closed (failures: {})", failure_count)
+                    }
+                    CircuitBreakerState::Open { .. } => "Open".to_string(),
+                    CircuitBreakerState::HalfOpen => "HalfOpen".to_string(),
+                }
+            })
         });
 
+        let total_requests = self.stats.total_requests.load(Ordering::Relaxed);
+        let successful_requests = self.stats.successful_requests.load(Ordering::Relaxed);
+
         let dict = PyDict::new(py);
-        dict.set_item("total_requests", stats.total_requests)?;
-        dict.set_item("successful_requests", stats.successful_requests)?;
-        dict.set_item("failed_requests", stats.failed_requests)?;
+        dict.set_item("total_requests", total_requests)?;
+        dict.set_item("successful_requests", successful_requests)?;
+        dict.set_item(
+            "failed_requests",
+            self.stats.failed_requests.load(Ordering::Relaxed),
+        )?;
         dict.set_item(
             "success_rate",
-            if stats.total_requests > 0 {
-                stats.successful_requests as f64 / stats.total_requests as f64
+            if total_requests > 0 {
+                successful_requests as f64 / total_requests as f64
             } else {
                 0.0
             },
         )?;
-        dict.set_item("average_response_time_ms", stats.average_response_time_ms)?;
-        dict.set_item("circuit_breaker_state", stats.circuit_breaker_state)?;
-        dict.set_item("uptime_seconds", stats.uptime.as_secs())?;
+        dict.set_item(
+            "average_response_time_ms",
+            self.stats.average_response_time_ms(),
+        )?;
+        dict.set_item(
+            "recent_response_time_ms",
+            self.stats.recent_response_time_ms(),
+        )?;
+        dict.set_item("circuit_breaker_state", circuit_breaker_state)?;
+        dict.set_item("uptime_seconds", self.created_at.elapsed().as_secs())?;
 
         Ok(dict)
     }
@@ -796,13 +836,7 @@ impl LlmClient {
 
     /// Reset client statistics
     fn reset_stats(&self) -> PyResult<()> {
-        get_runtime().block_on(async {
-            let mut stats = self.stats.write().await;
-            stats.total_requests = 0;
-            stats.successful_requests = 0;
-            stats.failed_requests = 0;
-            stats.average_response_time_ms = 0.0;
-        });
+        self.stats.reset();
         Ok(())
     }
 
@@ -959,7 +993,7 @@ impl LlmClient {
     async fn execute_with_resilience(
         provider: Arc<RwLock<Box<dyn LlmProviderTrait>>>,
         circuit_breaker: Arc<CircuitBreaker>,
-        stats: Arc<RwLock<ClientStats>>,
+        stats: Arc<ClientStats>,
         config: ClientConfig,
         prompt: String,
         max_tokens: Option<u32>,
@@ -993,7 +1027,7 @@ impl LlmClient {
     async fn execute_with_resilience_full(
         provider: Arc<RwLock<Box<dyn LlmProviderTrait>>>,
         circuit_breaker: Arc<CircuitBreaker>,
-        stats: Arc<RwLock<ClientStats>>,
+        stats: Arc<ClientStats>,
         config: ClientConfig,
         prompt: String,
         max_tokens: Option<u32>,
@@ -1015,21 +1049,68 @@ impl LlmClient {
             .await
     }
 
+    /// Run a batch of requests with bounded concurrency, returning each
+    /// response (or its error message) in the same order as `requests`
+    async fn execute_batch(
+        provider: Arc<RwLock<Box<dyn LlmProviderTrait>>>,
+        circuit_breaker: Arc<CircuitBreaker>,
+        stats: Arc<ClientStats>,
+        config: ClientConfig,
+        requests: Vec<LlmRequest>,
+        concurrency: usize,
+    ) -> Vec<String> {
+        // Requests finish in completion order so a slow prompt never holds up
+        // the rest; each result is tagged with its index and written back
+        // into its prompt's slot
+        let mut responses = vec![String::new(); requests.len()];
+        let mut results = futures::stream::iter(requests.into_iter().enumerate())
+            .map(|(index, request)| {
+                let provider = Arc::clone(&provider);
+                let circuit_breaker = Arc::clone(&circuit_breaker);
+                let stats = Arc::clone(&stats);
+                let config = config.clone();
+
+                async move {
+                    let result = Self::execute_request_with_resilience(
+                        provider,
+                        circuit_breaker,
+                        stats,
+                        config,
+                        request,
+                    )
+                    .await;
+                    (index, result)
+                }
+            })
+            .buffer_unordered(concurrency);
+
+        while let Some((index, res)) = results.next().await {
+            responses[index] = match res {
+                Ok(response) => response.content,
+                Err(e) => {
+                    if config.debug {
+                        warn!("Batch request failed: {}", e);
+                    }
+                    format!("Error: {}", e)
+                }
+            };
+        }
+
+        responses
+    }
+
     /// Execute a single request with retry logic and circuit breaker
     async fn execute_request_with_resilience(
         provider: Arc<RwLock<Box<dyn LlmProviderTrait>>>,
         circuit_breaker: Arc<CircuitBreaker>,
-        stats: Arc<RwLock<ClientStats>>,
+        stats: Arc<ClientStats>,
         config: ClientConfig,
         request: LlmRequest,
     ) -> Result<graphbit_core::llm::LlmResponse, PyErr> {
         let start_time = Instant::now();
 
         // Update stats
-        {
-            let mut stats_guard = stats.write().await;
-            stats_guard.total_requests += 1;
-        }
+        stats.record_request();
 
         // Check circuit breaker
         if !circuit_breaker.can_execute().await {
@@ -1046,6 +1127,9 @@ impl LlmClient {
                 debug!("Executing LLM request (attempt {})", attempt + 1);
             }
 
+            // Minimum wait requested by the provider, e.g. a 429 Retry-After
+            let mut retry_after = None;
+
             let result = timeout(config.request_timeout, async {
                 let guard = provider.read().await;
                 guard.complete(request.clone()).await
@@ -1057,17 +1141,7 @@ impl LlmClient {
                     // Success - update stats and circuit breaker
                     let duration = start_time.elapsed();
 
-                    {
-                        let mut stats_guard = stats.write().await;
-                        stats_guard.successful_requests += 1;
-
-                        // Update average response time (simple moving average)
-                        let total_requests = stats_guard.total_requests as f64;
-                        stats_guard.average_response_time_ms =
-                            (stats_guard.average_response_time_ms * (total_requests - 1.0)
-                                + duration.as_millis() as f64)
-                                / total_requests;
-                    }
+                    stats.record_success(duration);
 
                     circuit_breaker.record_success().await;
                     if config.debug {
@@ -1080,8 +1154,26 @@ impl LlmClient {
                     if config.debug {
                         warn!("LLM request failed (attempt {}): {}", attempt + 1, e);
                     }
+                    let retryable = e.is_retryable();
+                    if let GraphBitError::RateLimit {
+                        retry_after_seconds,
+                        ..
+                    } = &e
+                    {
+                        retry_after = Some(Duration::from_secs(*retry_after_seconds));
+                    }
                     last_error = Some(to_py_error(e));
                     circuit_breaker.record_failure().await;
+
+                    // Retrying a validation or configuration error cannot succeed
+                    if !retryable {
+                        break;
+                    }
+                    // Surface the rate limit rather than wait longer than the
+                    // configured ceiling for the provider to recover
+                    if retry_after.is_some_and(|wait| wait > config.max_retry_delay) {
+                        break;
+                    }
                 }
                 Err(_) => {
                     if config.debug {
@@ -1103,16 +1195,18 @@ impl LlmClient {
 
             // Don't wait after the last attempt
             if attempt < config.max_retries {
-                tokio::time::sleep(delay).await;
+                // Jitter the backoff so concurrent clients don't retry in lockstep
                 delay = (delay * 2).min(config.max_retry_delay);
+                let jittered = {
+                    use rand::Rng;
+                    rand::rng().random_range(config.base_retry_delay.min(delay)..=delay)
+                };
+                tokio::time::sleep(jittered.max(retry_after.unwrap_or_default())).await;
             }
         }
 
         // Update failure stats
-        {
-            let mut stats_guard = stats.write().await;
-            stats_guard.failed_requests += 1;
-        }
+        stats.record_failure();
 
         Err(last_error.unwrap_or_else(|| {
             PyErr::new::<pyo3::exceptions::PyRuntimeError, _>("All retry attempts failed")
@@ -1309,3 +1403,150 @@ impl StreamIterator {
         })
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use async_trait::async_trait;
+    use graphbit_core::errors::GraphBitError;
+    use graphbit_core::llm::LlmResponse;
+    use std::sync::atomic::AtomicUsize;
+
+    /// Provider that fails every call with the same error and counts attempts
+    struct FailingProvider {
+        error: fn() -> GraphBitError,
+        calls: Arc<AtomicUsize>,
+    }
+
+    #[async_trait]
+    impl LlmProviderTrait for FailingProvider {
+        fn provider_name(&self) -> &str {
+            "mock"
+        }
+
+        fn model_name(&self) -> &str {
+            "mock-model"
+        }
+
+        async fn complete(&self, _request: LlmRequest) -> GraphBitResult<LlmResponse> {
+            self.calls.fetch_add(1, Ordering::SeqCst);
+            Err((self.error)())
+        }
+    }
+
+    fn test_config(max_retries: u32) -> ClientConfig {
+        ClientConfig {
+            max_retries,
+            base_retry_delay: Duration::from_millis(1),
+            max_retry_delay: Duration::from_millis(2),
+            circuit_breaker_enabled: false,
+            ..ClientConfig::default()
+        }
+    }
+
+    /// Run one resilient request against a failing provider and return the
+    /// number of attempts it made
+    async fn attempts_for(error: fn() -> GraphBitError, config: ClientConfig) -> usize {
+        let calls = Arc::new(AtomicUsize::new(0));
+        let provider: Box<dyn LlmProviderTrait> = Box::new(FailingProvider {
+            error,
+            calls: Arc::clone(&calls),
+        });
+
+        let result = LlmClient::execute_request_with_resilience(
+            Arc::new(RwLock::new(provider)),
+            Arc::new(CircuitBreaker::new(config.clone())),
+            Arc::new(ClientStats::default()),
+            config,
+            LlmRequest::new("hello"),
+        )
+        .await;
+
+        assert!(result.is_err());
+        calls.load(Ordering::SeqCst)
+    }
+
+    /// Provider that echoes the prompt, answering later prompts sooner so
+    /// completions arrive in reverse order
+    struct ReverseOrderProvider {
+        batch_size: u64,
+    }
+
+    #[async_trait]
+    impl LlmProviderTrait for ReverseOrderProvider {
+        fn provider_name(&self) -> &str {
+            "mock"
+        }
+
+        fn model_name(&self) -> &str {
+            "mock-model"
+        }
+
+        async fn complete(&self, request: LlmRequest) -> GraphBitResult<LlmResponse> {
+            let prompt = request.messages[0].content.clone();
+            let index: u64 = prompt.trim_start_matches("prompt-").parse().unwrap();
+            tokio::time::sleep(Duration::from_millis((self.batch_size - index) * 20)).await;
+            Ok(LlmResponse::new(prompt, "mock-model"))
+        }
+    }
+
+    #[tokio::test]
+    async fn test_batch_preserves_input_order() {
+        let batch_size = 5;
+        let prompts: Vec<String> = (0..batch_size).map(|i| format!("prompt-{i}")).collect();
+        let provider: Box<dyn LlmProviderTrait> = Box::new(ReverseOrderProvider { batch_size });
+        let config = test_config(0);
+
+        let responses = LlmClient::execute_batch(
+            Arc::new(RwLock::new(provider)),
+            Arc::new(CircuitBreaker::new(config.clone())),
+            Arc::new(ClientStats::default()),
+            config,
+            prompts.iter().cloned().map(LlmRequest::new).collect(),
+            batch_size as usize,
+        )
+        .await;
+
+        assert_eq!(responses, prompts);
+    }
+
+    #[tokio::test]
+    async fn test_non_retryable_error_is_not_retried() {
+        let attempts = attempts_for(|| GraphBitError::config("bad config"), test_config(3)).await;
+        assert_eq!(attempts, 1);
+    }
+
+    #[tokio::test]
+    async fn test_retryable_error_uses_every_attempt() {
+        let attempts = attempts_for(
+            || GraphBitError::llm_provider("mock", "server error"),
+            test_config(3),
+        )
+        .await;
+        assert_eq!(attempts, 4);
+    }
+
+    #[tokio::test]
+    async fn test_rate_limit_waits_for_retry_after() {
+        let config = ClientConfig {
+            max_retry_delay: Duration::from_secs(1),
+            ..test_config(1)
+        };
+        let start = Instant::now();
+        let attempts = attempts_for(|| GraphBitError::rate_limit("mock", 1), config).await;
+
+        assert_eq!(attempts, 2);
+        // The jittered backoff alone stays near 2ms, so only the hint explains this
+        assert!(start.elapsed() >= Duration::from_secs(1));
+    }
+
+    #[tokio::test]
+    async fn test_rate_limit_beyond_max_delay_is_not_retried() {
+        let start = Instant::now();
+        let attempts =
+            attempts_for(|| GraphBitError::rate_limit("mock", 3600), test_config(3)).await;
+
+        assert_eq!(attempts, 1);
+        assert!(start.elapsed() < Duration::from_secs(1));
+    }
+}
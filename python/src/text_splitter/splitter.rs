@@ -9,6 +9,7 @@ use graphbit_core::text_splitter::{
 };
 use pyo3::prelude::*;
 use pyo3::types::PyDict;
+use rayon::prelude::*;
 use std::collections::HashMap;
 
 use super::config::TextSplitterConfig;
@@ -24,8 +25,9 @@ pub struct TextChunk {
 impl TextChunk {
     /// Get the text content
     #[getter]
-    fn content(&self) -> String {
-        self.inner.content.clone()
+    fn content(&self) -> &str {
+        // Borrow so the Python string is built straight from the chunk buffer
+        &self.inner.content
     }
 
     /// Get the start index in the original text
@@ -86,6 +88,27 @@ impl TextChunk {
     }
 }
 
+/// Split every text in the batch across the rayon pool.
+///
+/// Callers release the GIL once around this, instead of once per text.
+/// Output order matches the input order.
+fn split_texts_parallel<S>(splitter: &S, texts: &[String]) -> PyResult<Vec<Vec<TextChunk>>>
+where
+    S: TextSplitterTrait + ?Sized,
+{
+    texts
+        .par_iter()
+        .map(|text| {
+            let chunks = splitter.split_text(text).map_err(to_py_runtime_error)?;
+
+            Ok(chunks
+                .into_iter()
+                .map(|chunk| TextChunk { inner: chunk })
+                .collect())
+        })
+        .collect()
+}
+
 /// Character-based text splitter
 #[pyclass]
 pub struct CharacterSplitter {
@@ -121,14 +144,7 @@ impl CharacterSplitter {
 
     /// Split a list of texts
     fn split_texts(&self, texts: Vec<String>, py: Python<'_>) -> PyResult<Vec<Vec<TextChunk>>> {
-        let mut all_chunks = Vec::new();
-
-        for text in texts {
-            let chunks = self.split_text(&text, py)?;
-            all_chunks.push(chunks);
-        }
-
-        Ok(all_chunks)
+        py.allow_threads(|| split_texts_parallel(self.inner.as_ref(), &texts))
     }
 
     /// Get the chunk size
@@ -197,14 +213,7 @@ impl TokenSplitter {
 
     /// Split a list of texts
     fn split_texts(&self, texts: Vec<String>, py: Python<'_>) -> PyResult<Vec<Vec<TextChunk>>> {
-        let mut all_chunks = Vec::new();
-
-        for text in texts {
-            let chunks = self.split_text(&text, py)?;
-            all_chunks.push(chunks);
-        }
-
-        Ok(all_chunks)
+        py.allow_threads(|| split_texts_parallel(self.inner.as_ref(), &texts))
     }
 
     /// Get the chunk size
@@ -272,14 +281,7 @@ impl SentenceSplitter {
 
     /// Split a list of texts
     fn split_texts(&self, texts: Vec<String>, py: Python<'_>) -> PyResult<Vec<Vec<TextChunk>>> {
-        let mut all_chunks = Vec::new();
-
-        for text in texts {
-            let chunks = self.split_text(&text, py)?;
-            all_chunks.push(chunks);
-        }
-
-        Ok(all_chunks)
+        py.allow_threads(|| split_texts_parallel(self.inner.as_ref(), &texts))
     }
 
     /// Get the chunk size
@@ -348,14 +350,7 @@ impl RecursiveSplitter {
 
     /// Split a list of texts
     fn split_texts(&self, texts: Vec<String>, py: Python<'_>) -> PyResult<Vec<Vec<TextChunk>>> {
-        let mut all_chunks = Vec::new();
-
-        for text in texts {
-            let chunks = self.split_text(&text, py)?;
-            all_chunks.push(chunks);
-        }
-
-        Ok(all_chunks)
+        py.allow_threads(|| split_texts_parallel(self.inner.as_ref(), &texts))
     }
 
     /// Get the chunk size
@@ -410,39 +405,40 @@ impl TextSplitter {
     }
 
     /// Split text into chunks
-    fn split_text(&self, text: &str) -> PyResult<Vec<TextChunk>> {
-        let chunks = self.inner.split_text(text).map_err(to_py_runtime_error)?;
+    fn split_text(&self, text: &str, py: Python<'_>) -> PyResult<Vec<TextChunk>> {
+        // Release GIL during text splitting for true parallelism
+        py.allow_threads(|| {
+            let chunks = self.inner.split_text(text).map_err(to_py_runtime_error)?;
 
-        Ok(chunks
-            .into_iter()
-            .map(|chunk| TextChunk { inner: chunk })
-            .collect())
+            Ok(chunks
+                .into_iter()
+                .map(|chunk| TextChunk { inner: chunk })
+                .collect())
+        })
     }
 
     /// Split a list of texts
-    fn split_texts(&self, texts: Vec<String>) -> PyResult<Vec<Vec<TextChunk>>> {
-        let mut all_chunks = Vec::new();
-
-        for text in texts {
-            let chunks = self.split_text(&text)?;
-            all_chunks.push(chunks);
-        }
-
-        Ok(all_chunks)
+    fn split_texts(&self, texts: Vec<String>, py: Python<'_>) -> PyResult<Vec<Vec<TextChunk>>> {
+        py.allow_threads(|| split_texts_parallel(self.inner.as_ref(), &texts))
     }
 
     /// Create chunks from text and return as list of dictionaries
-    fn create_documents(&self, text: &str) -> PyResult<Vec<HashMap<String, String>>> {
-        let chunks = self.split_text(text)?;
+    fn create_documents(
+        &self,
+        text: &str,
+        py: Python<'_>,
+    ) -> PyResult<Vec<HashMap<String, String>>> {
+        let chunks = self.split_text(text, py)?;
 
         Ok(chunks
             .into_iter()
             .map(|chunk| {
                 let mut doc = HashMap::new();
-                doc.insert("content".to_string(), chunk.content());
                 doc.insert("start_index".to_string(), chunk.start_index().to_string());
                 doc.insert("end_index".to_string(), chunk.end_index().to_string());
                 doc.insert("chunk_index".to_string(), chunk.chunk_index().to_string());
+                // Move the content out instead of cloning it
+                doc.insert("content".to_string(), chunk.inner.content);
                 doc
             })
             .collect())
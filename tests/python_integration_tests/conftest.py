@@ -0,0 +1,72 @@
+"""Shared fixtures for GraphBit integration tests."""
+
+import os
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional
+
+import pytest
+
+try:
+    import graphbit
+
+    GRAPHBIT_AVAILABLE = True
+except ImportError:
+    GRAPHBIT_AVAILABLE = False
+
+
+class AzureLlmCredentials(NamedTuple):
+    """Azure LLM connection settings read from the environment."""
+
+    api_key: str
+    endpoint: str
+    deployment: str
+    api_version: str
+
+
+@lru_cache(maxsize=1)
+def get_azurellm_credentials() -> Optional[AzureLlmCredentials]:
+    """Get Azure LLM credentials from environment variables."""
+    api_key = os.getenv("AZURELLM_API_KEY")
+    endpoint = os.getenv("AZURELLM_ENDPOINT")
+    deployment = os.getenv("AZURELLM_DEPLOYMENT")
+    api_version = os.getenv("AZURELLM_API_VERSION", "2024-10-21")
+
+    if api_key and endpoint and deployment:
+        return AzureLlmCredentials(api_key, endpoint, deployment, api_version)
+    return None
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list) -> None:
+    """Skip credential-gated tests once per session instead of once per test."""
+    if get_azurellm_credentials() is not None:
+        return
+    skip_azurellm = pytest.mark.skip(reason="Azure LLM credentials not available")
+    for item in items:
+        if item.get_closest_marker("azurellm"):
+            item.add_marker(skip_azurellm)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def init_graphbit() -> None:
+    """Initialize GraphBit once for the whole test session."""
+    if GRAPHBIT_AVAILABLE:
+        graphbit.init()
+
+
+@pytest.fixture(scope="session")
+def openai_embedding_client(init_graphbit: None) -> Any:
+    """Share one OpenAI embedding client, and its connection pool, across the session."""
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        pytest.skip("OPENAI_API_KEY not set")
+    config = graphbit.EmbeddingConfig.openai(api_key=api_key, model="text-embedding-3-small")
+    return graphbit.EmbeddingClient(config)
+
+
+@pytest.fixture(scope="session")
+def azure_credentials() -> AzureLlmCredentials:
+    """Session-scoped fixture for Azure LLM credentials."""
+    credentials = get_azurellm_credentials()
+    if not credentials:
+        pytest.skip("Azure LLM credentials not found. Set AZURELLM_API_KEY, AZURELLM_ENDPOINT, and AZURELLM_DEPLOYMENT environment variables.")
+    return credentials
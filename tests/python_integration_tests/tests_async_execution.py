@@ -2,6 +2,7 @@
 
 import asyncio
 import contextlib
+import logging
 import os
 import time
 from typing import Any
@@ -10,6 +11,8 @@ import pytest
 
 import graphbit
 
+logger = logging.getLogger(__name__)
+
 
 @pytest.mark.asyncio
 class TestActualAsyncLLMExecution:
@@ -177,7 +180,7 @@ class TestActualAsyncErrorHandling:
 class TestActualAsyncPerformance:
     """Integration tests for actual async performance characteristics."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def api_key(self) -> str:
         """Get OpenAI API key from environment."""
         api_key = os.getenv("OPENAI_API_KEY")
@@ -185,11 +188,19 @@ class TestActualAsyncPerformance:
             pytest.skip("OPENAI_API_KEY not set")
         return str(api_key)
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def openai_client(self, api_key: str) -> Any:
-        """Create OpenAI LLM client."""
+        """Create a warmed-up OpenAI LLM client shared by the class.
+
+        One capped request opens the connection up front so the first timed
+        call does not also pay for connection setup. The client's pool lives on
+        GraphBit's own runtime, so it outlives each test's event loop.
+        """
         config = graphbit.LlmConfig.openai(api_key, "gpt-3.5-turbo")
-        return graphbit.LlmClient(config)
+        client = graphbit.LlmClient(config)
+        with contextlib.suppress(Exception):
+            client.complete("ping", max_tokens=1)
+        return client
 
     @pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), reason="Requires OpenAI API key")
     async def test_async_vs_sync_performance(self, openai_client: Any) -> None:
@@ -437,7 +448,7 @@ class TestActualAsyncWorkflowExecution:
 class TestActualAsyncPerformanceMetrics:
     """Integration tests for actual async performance characteristics."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def api_key(self) -> str:
         """Get OpenAI API key from environment."""
         api_key = os.getenv("OPENAI_API_KEY")
@@ -445,11 +456,19 @@ class TestActualAsyncPerformanceMetrics:
             pytest.skip("OPENAI_API_KEY not set")
         return str(api_key)
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def openai_client(self, api_key: str) -> Any:
-        """Create OpenAI LLM client."""
+        """Create a warmed-up OpenAI LLM client shared by the class.
+
+        One capped request opens the connection up front so the first timed
+        call does not also pay for connection setup. The client's pool lives on
+        GraphBit's own runtime, so it outlives each test's event loop.
+        """
         config = graphbit.LlmConfig.openai(api_key, "gpt-3.5-turbo")
-        return graphbit.LlmClient(config)
+        client = graphbit.LlmClient(config)
+        with contextlib.suppress(Exception):
+            client.complete("ping", max_tokens=1)
+        return client
 
     @pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), reason="Requires OpenAI API key")
     async def test_async_vs_sync_performance(self, openai_client: Any) -> None:
@@ -476,39 +495,42 @@ class TestActualAsyncPerformanceMetrics:
             assert async_time < 30, f"Async execution took too long: {async_time}s"
 
             # Log performance for comparison
-            print(f"Sync time: {sync_time:.2f}s, Async time: {async_time:.2f}s")
+            logger.info("Sync time: %.2fs, Async time: %.2fs", sync_time, async_time)
 
         except Exception as e:
             pytest.fail(f"Async vs sync performance test failed: {e}")
 
     @pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), reason="Requires OpenAI API key")
-    async def test_concurrent_async_performance(self, openai_client: Any) -> None:
+    @pytest.mark.parametrize("mode", ["correctness", pytest.param("benchmark", marks=pytest.mark.perf)])
+    async def test_concurrent_async_performance(self, openai_client: Any, mode: str) -> None:
         """Test performance of concurrent async operations."""
         try:
             prompts = [f"What is {i} squared? Just the number." for i in range(2, 5)]
 
-            # Sequential async execution
-            sequential_start = time.time()
-            sequential_results = []
-            for prompt in prompts:
-                result = await openai_client.complete_async(prompt, max_tokens=10)
-                sequential_results.append(result)
-            sequential_time = time.time() - sequential_start
-
             # Concurrent async execution
-            concurrent_start = time.time()
+            concurrent_start = time.perf_counter()
             tasks = [openai_client.complete_async(prompt, max_tokens=10) for prompt in prompts]
             concurrent_results = await asyncio.gather(*tasks)
-            concurrent_time = time.time() - concurrent_start
+            concurrent_time = time.perf_counter() - concurrent_start
 
-            # Verify results
-            assert len(sequential_results) == len(prompts)
             assert len(concurrent_results) == len(prompts)
-            assert all(isinstance(r, str) and len(r) > 0 for r in sequential_results)
             assert all(isinstance(r, str) and len(r) > 0 for r in concurrent_results)
 
-            # Concurrent should generally be faster
-            print(f"Sequential: {sequential_time:.2f}s, Concurrent: {concurrent_time:.2f}s")
+            # The sequential baseline only matters for comparison, so it is
+            # reserved for the slow benchmark run
+            if mode == "benchmark":
+                sequential_start = time.perf_counter()
+                sequential_results = []
+                for prompt in prompts:
+                    result = await openai_client.complete_async(prompt, max_tokens=10)
+                    sequential_results.append(result)
+                sequential_time = time.perf_counter() - sequential_start
+
+                assert len(sequential_results) == len(prompts)
+                assert all(isinstance(r, str) and len(r) > 0 for r in sequential_results)
+
+                # Concurrent should generally be faster
+                logger.info("Sequential: %.2fs, Concurrent: %.2fs", sequential_time, concurrent_time)
 
             # Should complete in reasonable time
             assert concurrent_time < 60, f"Concurrent took too long: {concurrent_time}s"
@@ -544,7 +566,7 @@ class TestActualAsyncPerformanceMetrics:
             assert batch_time < 60, f"Batch async took too long: {batch_time}s"
 
             # Log performance comparison
-            print(f"Individual async: {individual_time:.2f}s, Batch async: {batch_time:.2f}s")
+            logger.info("Individual async: %.2fs, Batch async: %.2fs", individual_time, batch_time)
 
         except Exception as e:
             pytest.fail(f"Batch vs individual async performance test failed: {e}")
@@ -368,11 +368,11 @@ class TestPerformanceBenchmarking:
         client = graphbit.LlmClient(config)
 
         # Measure completion performance
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             result = client.complete("Quick test", max_tokens=5)
-            end_time = time.time()
+            end_time = time.perf_counter()
 
             assert isinstance(result, str)
 
@@ -400,18 +400,18 @@ class TestPerformanceBenchmarking:
 
         try:
             # Measure individual completions
-            individual_start = time.time()
+            individual_start = time.perf_counter()
             individual_results = []
             for prompt in prompts:
                 result = client.complete(prompt, max_tokens=5)
                 individual_results.append(result)
-            individual_end = time.time()
+            individual_end = time.perf_counter()
             individual_duration = individual_end - individual_start
 
             # Measure batch completion
-            batch_start = time.time()
+            batch_start = time.perf_counter()
             batch_results = client.complete_batch(prompts, max_tokens=5, max_concurrency=3)
-            batch_end = time.time()
+            batch_end = time.perf_counter()
             batch_duration = batch_end - batch_start
 
             # Verify results
@@ -440,9 +440,9 @@ class TestPerformanceBenchmarking:
             workflow.validate()
 
             # Measure execution performance
-            start_time = time.time()
+            start_time = time.perf_counter()
             result = executor.execute(workflow)
-            end_time = time.time()
+            end_time = time.perf_counter()
 
             assert isinstance(result, graphbit.WorkflowResult)
 
@@ -488,7 +488,7 @@ class TestCrossComponentPerformanceMonitoring:
 
         try:
             # Track performance across operations
-            overall_start = time.time()
+            overall_start = time.perf_counter()
 
             # 1. Direct LLM completion
             client_result = client.complete("Direct test", max_tokens=5)
@@ -497,7 +497,7 @@ class TestCrossComponentPerformanceMonitoring:
             workflow.validate()
             workflow_result = executor.execute(workflow)
 
-            overall_end = time.time()
+            overall_end = time.perf_counter()
 
             # Verify results
             assert isinstance(client_result, str)
@@ -550,14 +550,14 @@ class TestCrossComponentPerformanceMonitoring:
 
         try:
             # Perform concurrent operations
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             results = []
             for _i, client in enumerate(clients):
                 result = client.complete(f"Concurrent test {_i}", max_tokens=5)
                 results.append(result)
 
-            end_time = time.time()
+            end_time = time.perf_counter()
 
             # Verify all operations completed
             assert len(results) == len(clients)
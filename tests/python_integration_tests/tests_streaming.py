@@ -21,7 +21,6 @@ from typing import Any, Dict, List
 import pytest
 
 try:
-    import graphbit
     from graphbit import Executor, LlmConfig, Node, Workflow, WorkflowStreamIterator
     GRAPHBIT_AVAILABLE = True
 except ImportError:
@@ -37,13 +36,6 @@ pytestmark = pytest.mark.skipif(
 # Fixtures
 # ─────────────────────────────────────────────────────────────────────────────
 
-@pytest.fixture(scope="module", autouse=True)
-def init_graphbit() -> None:
-    """Initialize GraphBit once for the whole module."""
-    if GRAPHBIT_AVAILABLE:
-        graphbit.init()
-
-
 @pytest.fixture
 def llm_config() -> Any:
     """Return a real or placeholder LlmConfig.
@@ -5,12 +5,6 @@ import pytest
 import graphbit
 
 
-@pytest.fixture(autouse=True)
-def setup():
-    """Initialize GraphBit before each test."""
-    graphbit.init()
-
-
 class TestCharacterSplitter:
     """Test character-based text splitter."""
 
@@ -137,6 +131,18 @@ class TestTokenSplitter:
         assert len(all_chunks) == 3
         assert all(isinstance(chunks, list) for chunks in all_chunks)
 
+    def test_multiple_texts_preserves_order(self):
+        """Test that batch splitting matches per-text splitting in order."""
+        splitter = graphbit.TokenSplitter(chunk_size=5, chunk_overlap=1)
+        texts = [f"Document {i} has a few words of content to split apart." for i in range(50)]
+
+        all_chunks = splitter.split_texts(texts)
+
+        assert len(all_chunks) == len(texts)
+        for text, chunks in zip(texts, all_chunks):
+            expected = splitter.split_text(text)
+            assert [c.content for c in chunks] == [c.content for c in expected]
+
 
 class TestSentenceSplitter:
     """Test sentence-based text splitter."""
@@ -302,6 +308,18 @@ class TestGenericTextSplitter:
 
         assert len(chunks) > 0
 
+    def test_split_texts(self):
+        """Test generic splitter batch splitting."""
+        config = graphbit.TextSplitterConfig.character(50, 10)
+        splitter = graphbit.TextSplitter(config)
+
+        texts = [f"Document {i} with enough text to produce more than one chunk of output." for i in range(20)]
+        all_chunks = splitter.split_texts(texts)
+
+        assert len(all_chunks) == len(texts)
+        for text, chunks in zip(texts, all_chunks):
+            assert [c.content for c in chunks] == [c.content for c in splitter.split_text(text)]
+
     def test_create_documents(self):
         """Test document creation functionality."""
         config = graphbit.TextSplitterConfig.character(50, 10)
@@ -349,6 +367,17 @@ class TestEdgeCases:
         assert len(chunks) > 10
         assert all(len(chunk.content) <= 1000 for chunk in chunks)
 
+    def test_very_long_token(self):
+        """Test that a single very long word stays one token."""
+        splitter = graphbit.TokenSplitter(chunk_size=10, chunk_overlap=2)
+        text = "a" * 10000
+
+        chunks = splitter.split_text(text)
+
+        assert len(chunks) == 1
+        assert chunks[0].content == text
+        assert int(chunks[0].metadata["token_count"]) == 1
+
     def test_text_with_special_characters(self):
         """Test text with special characters."""
         splitter = graphbit.TokenSplitter(chunk_size=10, chunk_overlap=2)
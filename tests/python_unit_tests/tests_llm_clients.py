@@ -230,6 +230,7 @@ class TestLlmClient:
             "failed_requests",
             "success_rate",
             "average_response_time_ms",
+            "recent_response_time_ms",
             "circuit_breaker_state",
             "uptime_seconds",
         ]:
@@ -239,6 +240,7 @@ class TestLlmClient:
         assert stats2["total_requests"] == 0
         assert stats2["successful_requests"] == 0
         assert stats2["failed_requests"] == 0
+        assert stats2["recent_response_time_ms"] == 0.0
 
     @pytest.mark.asyncio
     async def test_llm_client_stats_average_updates(self):
@@ -253,6 +255,7 @@ class TestLlmClient:
         assert stats["total_requests"] >= 2
         assert stats["successful_requests"] >= 2
         assert stats["average_response_time_ms"] >= 0.0
+        assert stats["recent_response_time_ms"] > 0.0
 
     @pytest.mark.asyncio
     async def test_llm_client_invalid_params(self):
@@ -66,6 +66,7 @@ async fn test_retry_error_type_classification() {
     let rate_limit_error = errors::GraphBitError::RateLimit {
         provider: "openai".to_string(),
         retry_after_seconds: 60,
+        message: "Too many requests".to_string(),
     };
     assert_eq!(
         RetryableErrorType::from_error(&rate_limit_error),
@@ -345,6 +345,7 @@ async fn test_error_classification_and_routing() {
         GraphBitError::RateLimit {
             provider: "openai".to_string(),
             retry_after_seconds: 30,
+            message: "Too many requests".to_string(),
         },
         GraphBitError::Authentication {
             provider: "anthropic".to_string(),
@@ -65,6 +65,7 @@ fn test_error_retryability() {
     let rate_limit_err = GraphBitError::RateLimit {
         provider: "openai".to_string(),
         retry_after_seconds: 30,
+        message: "Too many requests".to_string(),
     };
     assert!(rate_limit_err.is_retryable());
     assert_eq!(rate_limit_err.retry_delay(), Some(30));
@@ -103,6 +104,69 @@ fn test_error_retryability() {
     assert_eq!(internal_err.retry_delay(), None);
 }
 
+#[test]
+fn test_rate_limit_from_response() {
+    use graphbit_core::errors::DEFAULT_RATE_LIMIT_RETRY_SECONDS;
+    use reqwest::header::{HeaderMap, HeaderValue, RETRY_AFTER};
+    use reqwest::StatusCode;
+
+    // A 429 with a numeric Retry-After carries that delay and the provider's text
+    let body = r#"{"error":{"code":"insufficient_quota"}}"#;
+    let mut headers = HeaderMap::new();
+    headers.insert(RETRY_AFTER, HeaderValue::from_static("17"));
+    let err = GraphBitError::rate_limit_from_response(
+        "openai",
+        StatusCode::TOO_MANY_REQUESTS,
+        &headers,
+        body,
+    )
+    .expect("429 should map to a rate limit error");
+    assert!(matches!(err, GraphBitError::RateLimit { ref provider, .. } if provider == "openai"));
+    assert!(matches!(err, GraphBitError::RateLimit { ref message, .. } if message == body));
+    assert!(err.to_string().contains("insufficient_quota"));
+    assert!(err.is_retryable());
+    assert_eq!(err.retry_delay(), Some(17));
+
+    // Missing or date-valued Retry-After falls back to the default wait
+    let err = GraphBitError::rate_limit_from_response(
+        "azurellm",
+        StatusCode::TOO_MANY_REQUESTS,
+        &HeaderMap::new(),
+        "",
+    )
+    .unwrap();
+    assert_eq!(err.retry_delay(), Some(DEFAULT_RATE_LIMIT_RETRY_SECONDS));
+
+    headers.insert(
+        RETRY_AFTER,
+        HeaderValue::from_static("Wed, 21 Oct 2015 07:28:00 GMT"),
+    );
+    let err = GraphBitError::rate_limit_from_response(
+        "openai",
+        StatusCode::TOO_MANY_REQUESTS,
+        &headers,
+        "",
+    )
+    .unwrap();
+    assert_eq!(err.retry_delay(), Some(DEFAULT_RATE_LIMIT_RETRY_SECONDS));
+
+    // Other statuses are left to the provider's own error handling
+    assert!(GraphBitError::rate_limit_from_response(
+        "openai",
+        StatusCode::INTERNAL_SERVER_ERROR,
+        &headers,
+        ""
+    )
+    .is_none());
+    assert!(GraphBitError::rate_limit_from_response(
+        "openai",
+        StatusCode::BAD_REQUEST,
+        &headers,
+        ""
+    )
+    .is_none());
+}
+
 #[test]
 fn test_error_from_conversions() {
     // Test From<serde_json::Error>
@@ -140,6 +204,7 @@ fn test_retryable_error_type_classification() {
     let rate_limit_err = GraphBitError::RateLimit {
         provider: "test".to_string(),
         retry_after_seconds: 1,
+        message: "Too many requests".to_string(),
     };
     let error_type = RetryableErrorType::from_error(&rate_limit_err);
     assert_eq!(error_type, RetryableErrorType::RateLimitError);
@@ -254,8 +319,9 @@ fn test_error_display_formatting() {
             GraphBitError::RateLimit {
                 provider: "anthropic".to_string(),
                 retry_after_seconds: 120,
+                message: "Too many requests".to_string(),
             },
-            "Rate limit exceeded: anthropic - retry after 120s",
+            "Rate limit exceeded: anthropic - retry after 120s - Too many requests",
         ),
     ];
 
@@ -136,6 +136,7 @@ fn test_error_retryability_comprehensive() {
     let rate_limit_error = GraphBitError::RateLimit {
         provider: "openai".to_string(),
         retry_after_seconds: 15,
+        message: "Too many requests".to_string(),
     };
     assert!(rate_limit_error.is_retryable());
     assert_eq!(rate_limit_error.retry_delay(), Some(15));
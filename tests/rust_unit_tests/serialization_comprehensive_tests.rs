@@ -380,6 +380,7 @@ fn test_error_serialization_with_context() {
         GraphBitError::RateLimit {
             provider: "anthropic".to_string(),
             retry_after_seconds: 120,
+            message: "Too many requests".to_string(),
         },
         GraphBitError::Network {
             message: "Connection timeout".to_string(),
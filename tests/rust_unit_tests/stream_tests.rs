@@ -240,7 +240,8 @@ fn test_error_type_from_graphbit_error() {
     assert_eq!(
         error_type_from_graphbit_error(&GraphBitError::RateLimit {
             provider: "openai".to_string(),
-            retry_after_seconds: 30
+            retry_after_seconds: 30,
+            message: "Too many requests".to_string()
         }),
         "runtime_error"
     );
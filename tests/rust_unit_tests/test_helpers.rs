@@ -229,6 +229,7 @@ pub(super) fn create_test_errors() -> Vec<graphbit_core::errors::GraphBitError>
         graphbit_core::errors::GraphBitError::RateLimit {
             provider: "test_provider".to_string(),
             retry_after_seconds: 30,
+            message: "Too many requests".to_string(),
         },
     ]
 }